@@ -9,11 +9,32 @@ basicConfig(level="INFO")
 
 load_dotenv()
 
+# 環境変数は起動時に一度だけ読み込む
+EMOJI_LOG_CHANNEL_NAME = os.environ.get("EMOJI_LOG_CHANNEL_NAME")
+IS_DEBUG = bool(os.environ.get("IS_DEBUG"))
+
 intents = discord.Intents.default()
 intents.emojis_and_stickers = True  # Required to receive on_guild_emojis_update
 
 CLIENT = discord.Client(intents=intents)
 
+# guild.id -> ログ出力先のチャンネル(スレッド)ID
+LOG_CHANNEL_IDS: dict[int, int] = {}
+
+def get_log_channel(guild: discord.Guild) -> discord.Thread | discord.TextChannel | None:
+    # キャッシュ済みのIDで引けて名前も変わっていなければ、チャンネル一覧の走査を省く
+    channel_id = LOG_CHANNEL_IDS.get(guild.id)
+    if channel_id is not None:
+        channel = guild.get_channel_or_thread(channel_id)
+        if channel is not None and channel.name == EMOJI_LOG_CHANNEL_NAME:
+            return channel
+
+    channel_list = guild.threads if IS_DEBUG else guild.text_channels
+    channel = discord.utils.get(channel_list, name=EMOJI_LOG_CHANNEL_NAME)
+    if channel is not None:
+        LOG_CHANNEL_IDS[guild.id] = channel.id
+    return channel
+
 @CLIENT.event
 async def on_ready():
     print(f'We have logged in as {CLIENT.user}')
@@ -38,25 +59,17 @@ async def on_guild_emojis_update(guild: discord.Guild, before: list[discord.Emoj
         return
 
     logger.info("-" * 20)
-    logger.info(f"Guild: {guild.name}")
+    logger.info("Guild: %s", guild.name)
     logger.info(state)
     logger.info(message)
 
     # send event
-    channel_name = os.getenv("EMOJI_LOG_CHANNEL_NAME")
-
-    def send_message(channel_list: list[discord.Thread | discord.TextChannel]):
-        channel = discord.utils.get(channel_list, name=channel_name)
-        if channel is not None:
-            return channel.send(message)
-        else:
-            logger.error(f"{channel_name} channel not found")
-            return None
-
-    if os.getenv("IS_DEBUG"):
-        await send_message(guild.threads)
-    else:
-        await send_message(guild.text_channels)
+    channel = get_log_channel(guild)
+    if channel is None:
+        logger.error("%s channel not found", EMOJI_LOG_CHANNEL_NAME)
+        return
+
+    await channel.send(message)
 
 if __name__ == "__main__":
     token = os.getenv("DISCORD_BOT_TOKEN")